@@ -290,6 +290,17 @@ export const CATEGORIES: Record<string, CategoryInfo> = {
   },
 };
 
+// City key → category slug, built once instead of scanning CATEGORIES per hub page
+const CATEGORY_BY_CITY = new Map<string, string>();
+for (const [slug, info] of Object.entries(CATEGORIES)) {
+  if (info.city && !CATEGORY_BY_CITY.has(info.city)) CATEGORY_BY_CITY.set(info.city, slug);
+}
+
+/** Returns the city-type category slug for a city key (e.g. 'salem'), if one exists. */
+export function getCategorySlugForCity(city: string): string | undefined {
+  return CATEGORY_BY_CITY.get(city);
+}
+
 let _cache: Article[] | null = null;
 
 /**
@@ -306,16 +317,13 @@ function isPublished(dateStr: string): boolean {
 }
 
 /**
- * Returns all articles with date <= today (date-gated for drip-feed).
- * Future-dated articles are excluded from routes, sitemap, and RSS.
+ * Reads and normalizes every article JSON file, newest first.
+ * Shared by getAllArticles() and getAllArticlesUnfiltered().
  */
-export function getAllArticles(): Article[] {
-  if (_cache) return _cache;
-
+function loadArticles(): Article[] {
   const dir = join(process.cwd(), 'src/data/articles');
   const files = readdirSync(dir).filter((f) => f.endsWith('.json'));
-
-  const articles: Article[] = files
+  return files
     .map((file) => {
       const raw = readFileSync(join(dir, file), 'utf-8');
       const data = JSON.parse(raw) as ArticleJson;
@@ -347,9 +355,17 @@ export function getAllArticles(): Article[] {
       };
     })
     .sort((a, b) => new Date(b.date).getTime() - new Date(a.date).getTime());
+}
+
+/**
+ * Returns all articles with date <= today (date-gated for drip-feed).
+ * Future-dated articles are excluded from routes, sitemap, and RSS.
+ */
+export function getAllArticles(): Article[] {
+  if (_cache) return _cache;
 
   // Date gate: exclude future-dated articles (drip-feed)
-  _cache = articles.filter((a) => isPublished(a.date));
+  _cache = loadArticles().filter((a) => isPublished(a.date));
 
   return _cache;
 }
@@ -359,40 +375,7 @@ export function getAllArticles(): Article[] {
  * Do NOT use this in page generation, sitemap, or RSS.
  */
 export function getAllArticlesUnfiltered(): Article[] {
-  const dir = join(process.cwd(), 'src/data/articles');
-  const files = readdirSync(dir).filter((f) => f.endsWith('.json'));
-  return files
-    .map((file) => {
-      const raw = readFileSync(join(dir, file), 'utf-8');
-      const data = JSON.parse(raw) as ArticleJson;
-      const img =
-        typeof data.featuredImage === 'string'
-          ? { sourceUrl: data.featuredImage, altText: data.title }
-          : {
-              sourceUrl: data.featuredImage.sourceUrl,
-              altText: data.featuredImage.altText ?? data.title,
-              width: data.featuredImage.width,
-              height: data.featuredImage.height,
-            };
-      return {
-        title: data.title,
-        slug: data.slug,
-        content: data.content,
-        excerpt: data.excerpt || '',
-        date: data.date,
-        modified: data.modified,
-        featuredImage: img,
-        categories: data.categories.map((c) =>
-          typeof c === 'string'
-            ? { id: 0, slug: c, name: c }
-            : { id: c.id ?? 0, slug: c.slug, name: c.name, description: c.description }
-        ),
-        wordCount: data.wordCount,
-        readingTime: data.readingTime,
-        keywords: data.keywords,
-      };
-    })
-    .sort((a, b) => new Date(b.date).getTime() - new Date(a.date).getTime());
+  return loadArticles();
 }
 
 export function getArticlesByCategory(categorySlug: string): Article[] {
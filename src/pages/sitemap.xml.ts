@@ -6,7 +6,7 @@ import { getAllBlogHubSlugs } from '../data/hubs';
 
 export const GET: APIRoute = async () => {
   const site = 'https://cursedtours.com';
-  const now = new Date().toISOString().split('T')[0];
+  const now = new Date().toISOString().slice(0, 10);
 
   // Derive city hubs dynamically from CATEGORIES — no manual updates needed
   const cityHubs = [...new Set(
@@ -0,0 +1,48 @@
+/**
+ * Word counting shared by the reading-time helper and the Node validators in tests/.
+ * Plain JS so both Astro and bare `node` can import it.
+ */
+
+/**
+ * Whether a UTF-16 code unit is whitespace under the regex `\s` class.
+ *
+ * @param {number} c - Code unit from charCodeAt
+ * @returns {boolean}
+ */
+function isWhitespace(c) {
+  if (c > 32 && c < 160) return false;
+  return (
+    c === 32 ||
+    (c >= 9 && c <= 13) ||
+    c === 160 ||
+    c === 0x1680 ||
+    (c >= 0x2000 && c <= 0x200a) ||
+    c === 0x2028 ||
+    c === 0x2029 ||
+    c === 0x202f ||
+    c === 0x205f ||
+    c === 0x3000 ||
+    c === 0xfeff
+  );
+}
+
+/**
+ * Count whitespace-separated words without building an intermediate array.
+ * Matches `text.split(/\s+/).filter(Boolean).length`.
+ *
+ * @param {string} text - Raw article body
+ * @returns {number} Number of words
+ */
+export function countWords(text) {
+  let words = 0;
+  let inWord = false;
+  for (let i = 0; i < text.length; i++) {
+    if (isWhitespace(text.charCodeAt(i))) {
+      inWord = false;
+    } else if (!inWord) {
+      inWord = true;
+      words++;
+    }
+  }
+  return words;
+}
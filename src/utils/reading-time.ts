@@ -0,0 +1,35 @@
+import type { CollectionEntry } from 'astro:content';
+import { countWords } from './count-words.mjs';
+
+type ArticleEntry = CollectionEntry<'articles'>;
+
+const WORDS_PER_MINUTE = 250;
+
+// Listing pages sort by word count and then render reading time for the
+// same entries, so count each article body once per build.
+const wordCounts = new WeakMap<ArticleEntry, number>();
+
+/**
+ * Word count of an article body, memoized per collection entry.
+ *
+ * @param {ArticleEntry} entry - Article collection entry
+ * @returns {number} Number of whitespace-separated words
+ */
+export function getWordCount(entry: ArticleEntry): number {
+  let count = wordCounts.get(entry);
+  if (count === undefined) {
+    count = entry.body ? countWords(entry.body) : 0;
+    wordCounts.set(entry, count);
+  }
+  return count;
+}
+
+/**
+ * Estimated reading time in minutes (~250 wpm).
+ *
+ * @param {ArticleEntry} entry - Article collection entry
+ * @returns {number} Reading time, rounded up to whole minutes (at least 1)
+ */
+export function getReadingTime(entry: ArticleEntry): number {
+  return Math.max(1, Math.ceil(getWordCount(entry) / WORDS_PER_MINUTE));
+}
@@ -0,0 +1,33 @@
+/**
+ * Shared article rules for the validation and auto-fix scripts.
+ * Keep in sync with CATEGORIES in src/data/articles.ts.
+ */
+
+// ── Valid categories (from src/data/articles.ts) ──
+export const VALID_CATEGORIES = [
+  'salem-witch-trials',
+  'new-orleans-voodoo-haunted-history',
+  'chicago-haunted-history',
+  'savannah-haunted-history',
+  'charleston-haunted-history',
+  'boston-haunted-history',
+  'edinburgh-haunted-history',
+  'london-haunted-history',
+  'new-york-haunted-history',
+  'st-augustine-haunted-history',
+  'san-antonio-haunted-history',
+  'rome-haunted-history',
+  'paris-haunted-history',
+  'dublin-haunted-history',
+  'washington-dc-haunted-history',
+  'nashville-haunted-history',
+  'austin-haunted-history',
+  'denver-haunted-history',
+  'key-west-haunted-history',
+  'vampire-culture',
+  'salem-witch-trials-history',
+  'tower-of-london-history',
+  'american-prison-history',
+  'gettysburg-civil-war',
+  'pop-culture-dark-history',
+];
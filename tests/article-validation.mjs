@@ -8,42 +8,25 @@
  */
 
 import { existsSync, readFileSync, readdirSync } from 'fs';
-import { dirname, join } from 'path';
+import { basename, dirname, join } from 'path';
 import { fileURLToPath } from 'url';
+import { countWords } from '../src/utils/count-words.mjs';
+import { VALID_CATEGORIES as SHARED_CATEGORIES } from './article-rules.mjs';
 
 const __dirname = dirname(fileURLToPath(import.meta.url));
 const ROOT = join(__dirname, '..');
 const ARTICLES_DIR = join(ROOT, 'src', 'data', 'articles');
 const IMAGES_DIR = join(ROOT, 'public', 'images', 'articles');
 
-// ── Valid categories (from src/data/articles.ts) ──
-const VALID_CATEGORIES = new Set([
-  'salem-witch-trials',
-  'new-orleans-voodoo-haunted-history',
-  'chicago-haunted-history',
-  'savannah-haunted-history',
-  'charleston-haunted-history',
-  'boston-haunted-history',
-  'edinburgh-haunted-history',
-  'london-haunted-history',
-  'new-york-haunted-history',
-  'st-augustine-haunted-history',
-  'san-antonio-haunted-history',
-  'rome-haunted-history',
-  'paris-haunted-history',
-  'dublin-haunted-history',
-  'washington-dc-haunted-history',
-  'nashville-haunted-history',
-  'austin-haunted-history',
-  'denver-haunted-history',
-  'key-west-haunted-history',
-  'vampire-culture',
-  'salem-witch-trials-history',
-  'tower-of-london-history',
-  'american-prison-history',
-  'gettysburg-civil-war',
-  'pop-culture-dark-history',
-]);
+// ── Article images, listed once instead of one existsSync per article ──
+const ARTICLE_IMAGES = new Set(existsSync(IMAGES_DIR) ? readdirSync(IMAGES_DIR) : []);
+
+function imageExists(path) {
+  return dirname(path) === IMAGES_DIR ? ARTICLE_IMAGES.has(basename(path)) : existsSync(path);
+}
+
+// ── Valid categories (shared with auto-fix.mjs) ──
+const VALID_CATEGORIES = new Set(SHARED_CATEGORIES);
 
 // ── Test runner ──
 let pass = 0;
@@ -174,7 +157,7 @@ for (const file of files) {
 
   // 9. CONTENT QUALITY
   if (data.content) {
-    const wordCount = data.content.split(/\s+/).filter(Boolean).length;
+    const wordCount = countWords(data.content);
     if (wordCount < 300) {
       bad(`Content is only ${wordCount} words (minimum 300)`, file);
     } else if (wordCount < 800) {
@@ -214,9 +197,8 @@ for (const file of files) {
       const imgPath = imgSrc.startsWith('/')
         ? join(ROOT, 'public', imgSrc)
         : join(IMAGES_DIR, imgSrc);
-      if (!existsSync(imgPath)) {
-        const altPath = join(IMAGES_DIR, `${data.slug}.webp`);
-        if (!existsSync(altPath)) {
+      if (!imageExists(imgPath)) {
+        if (!ARTICLE_IMAGES.has(`${data.slug}.webp`)) {
           notice(`Featured image not found: ${imgSrc}`, file);
         }
       } else {
@@ -20,9 +20,11 @@
  *   --apply    Actually write fixes to disk
  */
 
-import { readdirSync, readFileSync, statSync, writeFileSync } from 'fs';
+import { readdirSync, readFileSync, renameSync, statSync, writeFileSync } from 'fs';
 import { dirname, join } from 'path';
 import { fileURLToPath } from 'url';
+import { countWords } from '../src/utils/count-words.mjs';
+import { VALID_CATEGORIES } from './article-rules.mjs';
 
 const __dirname = dirname(fileURLToPath(import.meta.url));
 const ROOT = join(__dirname, '..');
@@ -32,34 +34,6 @@ const REPORT_PATH = join(ROOT, 'tests', 'fix-report.json');
 const args = process.argv.slice(2);
 const DRY_RUN = !args.includes('--apply');
 
-// ── Valid categories ──
-const VALID_CATEGORIES = [
-  'salem-witch-trials',
-  'new-orleans-voodoo-haunted-history',
-  'chicago-haunted-history',
-  'savannah-haunted-history',
-  'charleston-haunted-history',
-  'boston-haunted-history',
-  'edinburgh-haunted-history',
-  'london-haunted-history',
-  'new-york-haunted-history',
-  'st-augustine-haunted-history',
-  'san-antonio-haunted-history',
-  'rome-haunted-history',
-  'paris-haunted-history',
-  'dublin-haunted-history',
-  'washington-dc-haunted-history',
-  'nashville-haunted-history',
-  'austin-haunted-history',
-  'denver-haunted-history',
-  'key-west-haunted-history',
-  'vampire-culture',
-  'salem-witch-trials-history',
-  'tower-of-london-history',
-  'american-prison-history',
-  'gettysburg-civil-war',
-];
-
 // ── Tracking ──
 const autoFixed = [];
 const proposed = [];
@@ -92,6 +66,13 @@ function nextId() {
   return id;
 }
 
+// ── Write JSON via temp file + rename so an interrupted run never truncates a file ──
+function writeJsonAtomic(path, data) {
+  const tmp = `${path}.tmp`;
+  writeFileSync(tmp, JSON.stringify(data, null, 2) + '\n', 'utf-8');
+  renameSync(tmp, path);
+}
+
 // ── Levenshtein distance for category suggestion ──
 function levenshtein(a, b) {
   const m = a.length,
@@ -177,7 +158,7 @@ for (const { file, data, path } of articles) {
     if (isNaN(d.getTime())) {
       // Try to get from file mtime
       const mtime = statSync(path).mtime;
-      data.date = mtime.toISOString().split('T')[0];
+      data.date = mtime.toISOString().slice(0, 10);
       autoFixed.push({ file, fix: `Invalid date → ${data.date} (from file mtime)`, tier: 1 });
       modified = true;
     }
@@ -227,7 +208,7 @@ for (const { file, data, path } of articles) {
 
   // TIER 2: Content too short
   if (data.content) {
-    const wordCount = data.content.split(/\s+/).filter(Boolean).length;
+    const wordCount = countWords(data.content);
     if (wordCount < 300) {
       proposed.push({
         file,
@@ -259,11 +240,19 @@ for (const { file, data, path } of articles) {
   if (modified) {
     filesModified++;
     if (!DRY_RUN) {
-      writeFileSync(path, JSON.stringify(data, null, 2) + '\n', 'utf-8');
+      writeJsonAtomic(path, data);
     }
   }
 }
 
+// ── Split proposals by severity once for the report and console ──
+const tier2Errors = [];
+const tier2Warnings = [];
+for (const p of proposed) {
+  if (p.severity === 'error') tier2Errors.push(p);
+  else if (p.severity === 'warning') tier2Warnings.push(p);
+}
+
 // ── Write fix report ──
 const report = {
   timestamp: new Date().toISOString(),
@@ -271,15 +260,15 @@ const report = {
   summary: {
     articlesScanned: articles.length,
     autoFixed: autoFixed.length,
-    proposedFixes: proposed.filter((p) => p.severity === 'error').length,
-    warnings: proposed.filter((p) => p.severity === 'warning').length,
+    proposedFixes: tier2Errors.length,
+    warnings: tier2Warnings.length,
     filesModified,
   },
   tier1_autoFixed: autoFixed,
   tier2_proposed: proposed,
 };
 
-writeFileSync(REPORT_PATH, JSON.stringify(report, null, 2) + '\n', 'utf-8');
+writeJsonAtomic(REPORT_PATH, report);
 
 // ── Console Output ──
 console.log(`  Scanned: ${articles.length} articles`);
@@ -293,9 +282,6 @@ if (autoFixed.length > 0) {
   console.log('');
 }
 
-const tier2Errors = proposed.filter((p) => p.severity === 'error');
-const tier2Warnings = proposed.filter((p) => p.severity === 'warning');
-
 if (tier2Errors.length > 0) {
   console.log(`  TIER 2 — Needs Review (${tier2Errors.length} errors):`);
   for (const p of tier2Errors) {
@@ -140,6 +140,15 @@ if (emptyCount === 0) {
   ok('No empty/tiny HTML files');
 }
 
+// ── Count occurrences of a literal without materializing a match array ──
+function countOccurrences(text, needle) {
+  let count = 0;
+  for (let i = text.indexOf(needle); i !== -1; i = text.indexOf(needle, i + needle.length)) {
+    count++;
+  }
+  return count;
+}
+
 // ── Sitemap check ──
 const sitemapPath = join(DIST, 'sitemap.xml');
 if (existsSync(sitemapPath)) {
@@ -149,7 +158,7 @@ if (existsSync(sitemapPath)) {
   } else {
     bad('Sitemap exists but has no <sitemapindex> or <urlset> root');
   }
-  const locCount = (sitemap.match(/<loc>/g) || []).length;
+  const locCount = countOccurrences(sitemap, '<loc>');
   if (locCount > 0) {
     console.log(`  Sitemap has ${locCount} entries`);
     ok('Sitemap has entries');
@@ -57,14 +57,34 @@ function extractTourObjects(block) {
   return [...block.matchAll(/\{[\s\S]*?\n\s*\}/g)].map((match) => match[0]);
 }
 
+// Field patterns are compiled once per field name and reused for every tour object
+const FIELD_PATTERNS = new Map();
+const STRING_FIELD_PATTERNS = new Map();
+
+function fieldPattern(field) {
+  let re = FIELD_PATTERNS.get(field);
+  if (!re) {
+    re = new RegExp(`\\b${field}\\s*:`, 'm');
+    FIELD_PATTERNS.set(field, re);
+  }
+  return re;
+}
+
+function stringFieldPattern(field) {
+  let re = STRING_FIELD_PATTERNS.get(field);
+  if (!re) {
+    re = new RegExp(`${field}\\s*:\\s*['"\\x60]([^'"\\x60]+)['"\\x60]`, 'm');
+    STRING_FIELD_PATTERNS.set(field, re);
+  }
+  return re;
+}
+
 function hasField(objectText, field) {
-  return new RegExp(`\\b${field}\\s*:`, 'm').test(objectText);
+  return fieldPattern(field).test(objectText);
 }
 
 function extractStringField(objectText, field) {
-  const match = objectText.match(
-    new RegExp(`${field}\\s*:\\s*['"\\x60]([^'"\\x60]+)['"\\x60]`, 'm')
-  );
+  const match = objectText.match(stringFieldPattern(field));
   return match ? match[1] : null;
 }
 
@@ -208,33 +228,21 @@ for (const [, url] of viatorUrls) {
 }
 
 // ── Parse city blocks to check tour completeness ──
+// Record each key's offset in the same pass so blocks can be sliced directly
 const cityBlockPattern = /['"]([a-z-]+)['"]\s*:\s*\[/g;
 const cityKeys = [];
+const cityStarts = [];
 let cityMatch;
 while ((cityMatch = cityBlockPattern.exec(cityToursRaw)) !== null) {
   cityKeys.push(cityMatch[1]);
+  cityStarts.push(cityMatch.index);
 }
 console.log(`  Found ${cityKeys.length} cities in CITY_TOURS\n`);
 
-for (const city of cityKeys) {
-  const cityStart =
-    cityToursRaw.indexOf(`'${city}'`) !== -1
-      ? cityToursRaw.indexOf(`'${city}'`)
-      : cityToursRaw.indexOf(`"${city}"`);
-
-  if (cityStart === -1) {
-    continue;
-  }
-
-  const nextCityIdx = cityKeys.indexOf(city) + 1;
-  const endIdx =
-    nextCityIdx < cityKeys.length
-      ? cityToursRaw.indexOf(`'${cityKeys[nextCityIdx]}'`) !== -1
-        ? cityToursRaw.indexOf(`'${cityKeys[nextCityIdx]}'`)
-        : cityToursRaw.indexOf(`"${cityKeys[nextCityIdx]}"`)
-      : cityToursRaw.length;
-
-  const cityBlock = cityToursRaw.slice(cityStart, endIdx);
+for (let i = 0; i < cityKeys.length; i++) {
+  const city = cityKeys[i];
+  const endIdx = i + 1 < cityStarts.length ? cityStarts[i + 1] : cityToursRaw.length;
+  const cityBlock = cityToursRaw.slice(cityStarts[i], endIdx);
   const tourObjects = extractTourObjects(cityBlock);
   const tiers = tourObjects
     .map((objectText) => extractStringField(objectText, 'tier'))